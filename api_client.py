@@ -2,9 +2,15 @@
 API client for ktpncook recipe operations
 """
 
+import asyncio
+
+import aiohttp
 import requests
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
 from typing import List, Dict, Any, Optional
-from auth import KtpncookAuth
+from auth import KtpncookAuth, parse_json
 from recipe import Recipe
 
 
@@ -12,6 +18,8 @@ class KtpncookAPIClient:
     """Client for interacting with ktpncook API"""
 
     MOBILE_BASE_URL = "https://mobile.kptncook.com"
+    MAX_CONCURRENT_REQUESTS = 16
+    BATCH_SIZE = 25
 
     def __init__(self, auth: KtpncookAuth):
         """
@@ -23,6 +31,7 @@ class KtpncookAPIClient:
         if not auth.is_authenticated():
             raise ValueError("Authentication required")
         self.auth = auth
+        self.session = auth.session
 
     def get_favorites(self) -> List[str]:
         """
@@ -35,10 +44,10 @@ class KtpncookAPIClient:
         headers = self.auth.get_auth_headers()
 
         try:
-            response = requests.get(favorites_url, headers=headers)
+            response = self.session.get(favorites_url, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = parse_json(response)
             favorites = data.get("favorites", [])
             print(f"Found {len(favorites)} favorite recipes")
             return favorites
@@ -67,10 +76,10 @@ class KtpncookAPIClient:
         payload = [{"identifier": recipe_identifier}]
 
         try:
-            response = requests.post(search_url, json=payload, headers=headers)
+            response = self.session.post(search_url, json=payload, headers=headers)
             response.raise_for_status()
 
-            recipes = response.json()
+            recipes = parse_json(response)
             if recipes and len(recipes) > 0:
                 return Recipe.from_api_data(recipes[0])
             else:
@@ -81,25 +90,208 @@ class KtpncookAPIClient:
             print(f"Failed to get recipe details for {recipe_identifier}: {e}")
             return None
 
-    def get_all_recipe_details(self, favorites: List[str]) -> List[Recipe]:
+    async def _get_recipe_batch_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        identifiers: List[str]
+    ) -> List[Dict[str, Any]]:
         """
-        Get detailed information for all favorite recipes
+        Fetch a batch of recipes in a single search request
 
         Args:
-            favorites: List of recipe identifiers
+            session: Shared aiohttp session
+            semaphore: Semaphore bounding concurrent requests
+            identifiers: Recipe identifiers to fetch together
+
+        Returns:
+            List of raw recipe dictionaries from the API
+        """
+        search_url = f"{self.MOBILE_BASE_URL}/recipes/search?kptnkey={self.auth.kptn_key}&lang=de"
+
+        headers = {
+            "Content-Type": "application/json",
+            **self.auth.get_auth_headers()
+        }
+
+        payload = [{"identifier": identifier} for identifier in identifiers]
+
+        async with semaphore:
+            async with session.post(search_url, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+
+    def _get_recipe_batch(self, identifiers: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch a batch of recipes through the shared requests session
+
+        Used instead of the aiohttp path when response caching is enabled,
+        so repeat runs are served from the on-disk cache.
+
+        Args:
+            identifiers: Recipe identifiers to fetch together
+
+        Returns:
+            List of raw recipe dictionaries from the API
+        """
+        search_url = f"{self.MOBILE_BASE_URL}/recipes/search?kptnkey={self.auth.kptn_key}&lang=de"
+
+        headers = {
+            "Content-Type": "application/json",
+            **self.auth.get_auth_headers()
+        }
+
+        payload = [{"identifier": identifier} for identifier in identifiers]
+
+        response = self.session.post(search_url, json=payload, headers=headers)
+        response.raise_for_status()
+        return parse_json(response)
+
+    def _fetch_batches_cached(self, batches: List[List[str]]) -> List[Any]:
+        """Fetch all recipe batches through the cached session in a thread pool"""
+        results: List[Any] = [None] * len(batches)
+
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            futures = {
+                executor.submit(self._get_recipe_batch, batch): index
+                for index, batch in enumerate(batches)
+            }
+
+            with tqdm(total=len(futures), desc="Fetching recipes", unit="batch") as progress:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        results[index] = e
+                    progress.update(1)
+
+        return results
+
+    async def _fetch_batches_async(self, batches: List[List[str]]) -> List[Any]:
+        """Fetch all recipe batches concurrently, collecting exceptions per batch"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_REQUESTS)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [
+                asyncio.create_task(self._get_recipe_batch_async(session, semaphore, batch))
+                for batch in batches
+            ]
+            with tqdm(total=len(tasks), desc="Fetching recipes", unit="batch") as progress:
+                for task in tasks:
+                    task.add_done_callback(lambda _: progress.update(1))
+                return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_recipe_details_batch(self, identifiers: List[str], batch_size: int = BATCH_SIZE) -> List[Recipe]:
+        """
+        Get detailed information for multiple recipes with batched requests
+
+        The search endpoint accepts an array of identifiers, so N recipes only
+        need ceil(N / batch_size) round trips. Failed batches fall back to
+        per-identifier requests so one bad identifier doesn't lose the batch.
+
+        Args:
+            identifiers: List of recipe identifiers
+            batch_size: Number of identifiers per search request
 
         Returns:
             List of Recipe objects
         """
+        batches = [identifiers[i:i + batch_size] for i in range(0, len(identifiers), batch_size)]
+
+        # aiohttp bypasses the cached session, so cached runs must post
+        # through it (in a thread pool) to be answered from disk
+        if self.auth.cache_enabled:
+            results = self._fetch_batches_cached(batches)
+        else:
+            results = asyncio.run(self._fetch_batches_async(batches))
+
         detailed_recipes = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                print(f"Batch of {len(batch)} recipes failed ({result}), retrying individually")
+                detailed_recipes.extend(
+                    recipe for recipe in (self.get_recipe_details(identifier) for identifier in batch)
+                    if recipe
+                )
+            else:
+                detailed_recipes.extend(Recipe.from_api_data(recipe_data) for recipe_data in result)
+
+        return detailed_recipes
+
+    async def iter_recipe_details(self, favorites: List[str], batch_size: int = BATCH_SIZE):
+        """
+        Yield Recipe objects as their batches arrive (async generator)
+
+        Unlike get_recipe_details_batch this streams recipes out as soon as
+        each batch response lands, so downstream stages (image downloads,
+        PDF builds) can start on early recipes while later batches are
+        still in flight.
+
+        Args:
+            favorites: List of recipe identifiers
+            batch_size: Number of identifiers per search request
+        """
+        batches = [favorites[i:i + batch_size] for i in range(0, len(favorites), batch_size)]
+        loop = asyncio.get_running_loop()
 
-        for i, identifier in enumerate(favorites, 1):
-            print(f"Fetching details for recipe {i}/{len(favorites)}: {identifier}")
-            recipe = self.get_recipe_details(identifier)
+        # Cached runs post through the requests_cache session (in the default
+        # thread pool) so unchanged batches are answered from disk
+        if self.auth.cache_enabled:
+            async def fetch(batch: List[str]):
+                try:
+                    return batch, await loop.run_in_executor(None, self._get_recipe_batch, batch), None
+                except Exception as e:
+                    return batch, None, e
 
-            if recipe:
-                detailed_recipes.append(recipe)
+            async for recipe in self._drain_batches(fetch, batches, loop):
+                yield recipe
+            return
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_REQUESTS)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def fetch(batch: List[str]):
+                try:
+                    return batch, await self._get_recipe_batch_async(session, semaphore, batch), None
+                except Exception as e:
+                    return batch, None, e
+
+            async for recipe in self._drain_batches(fetch, batches, loop):
+                yield recipe
+
+    async def _drain_batches(self, fetch, batches: List[List[str]], loop):
+        """Yield recipes from batch fetches as each completes, with per-identifier fallback"""
+        for done in asyncio.as_completed([fetch(batch) for batch in batches]):
+            batch, result, error = await done
+
+            if error is not None:
+                print(f"Batch of {len(batch)} recipes failed ({error}), retrying individually")
+                for identifier in batch:
+                    recipe = await loop.run_in_executor(None, self.get_recipe_details, identifier)
+                    if recipe:
+                        yield recipe
             else:
-                print(f"Skipping recipe {identifier} - failed to fetch details")
+                for recipe_data in result:
+                    yield Recipe.from_api_data(recipe_data)
+
+    def get_all_recipe_details(self, favorites: List[str]) -> List[Recipe]:
+        """
+        Get detailed information for all favorite recipes
+
+        Args:
+            favorites: List of recipe identifiers
+
+        Returns:
+            List of Recipe objects
+        """
+        print(f"Fetching details for {len(favorites)} recipes in batches of {self.BATCH_SIZE}")
+        detailed_recipes = self.get_recipe_details_batch(favorites)
+
+        missing = len(favorites) - len(detailed_recipes)
+        if missing > 0:
+            print(f"Skipped {missing} recipes - failed to fetch details")
 
         return detailed_recipes
\ No newline at end of file
@@ -2,19 +2,37 @@
 Authentication module for ktpncook API
 """
 
+import atexit
 import os
+import orjson
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
-from dotenv import load_dotenv
+
+
+def parse_json(response: requests.Response):
+    """Decode a response body with orjson, which is faster than response.json()"""
+    return orjson.loads(response.content)
 
 
 class KtpncookAuth:
     """Handles authentication with the ktpncook API"""
 
     BASE_URL = "https://api.production.kptncook.com"
+    CACHE_NAME = ".kptncook_cache"
+
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize auth and load environment variables
+
+        Args:
+            use_cache: Cache API responses on disk so repeat runs skip
+                unchanged favorites and recipe details
+        """
+        from dotenv import load_dotenv
 
-    def __init__(self):
-        """Initialize auth and load environment variables"""
         load_dotenv()
         self.access_token: Optional[str] = None
         self.kptn_key = os.getenv("KPTNCOOK_API_KEY")
@@ -22,6 +40,36 @@ class KtpncookAuth:
         if not self.kptn_key:
             raise ValueError("KPTNCOOK_API_KEY not found in environment variables")
 
+        self.cache_enabled = use_cache
+
+        # Shared session so all API calls reuse pooled keep-alive connections
+        # instead of paying a fresh TCP+TLS handshake per request
+        if use_cache:
+            self.session = requests_cache.CachedSession(
+                cache_name=self.CACHE_NAME,
+                backend='sqlite',
+                expire_after=3600,
+                allowable_methods=('GET', 'POST'),
+                urls_expire_after={
+                    '*/auth/login': requests_cache.DO_NOT_CACHE,
+                    '*/favorites': 3600,
+                    '*/recipes/search*': 86400,
+                }
+            )
+        else:
+            self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount("https://", adapter)
+        atexit.register(self.session.close)
+
     def login_from_env(self) -> bool:
         """
         Authenticate using credentials from environment variables
@@ -61,10 +109,10 @@ class KtpncookAuth:
         }
 
         try:
-            response = requests.post(login_url, json=payload, headers=headers)
+            response = self.session.post(login_url, json=payload, headers=headers)
             response.raise_for_status()
 
-            data = response.json()
+            data = parse_json(response)
             self.access_token = data.get("accessToken")
 
             return self.access_token is not None
@@ -2,25 +2,67 @@
 Image downloader for recipe step images
 """
 
+import json
 import os
 import requests
-from typing import Dict, List, Optional
+import shutil
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from tqdm import tqdm
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from recipe import Recipe
 import hashlib
 
 
+@lru_cache(maxsize=4096)
+def _compute_url_hash(url: str) -> Tuple[str, str]:
+    """Compute (extension, short hash) for an image URL, cached per URL"""
+    # Parse URL to get file extension
+    parsed_url = urlparse(url)
+    path = parsed_url.path
+    extension = os.path.splitext(path)[1] or '.jpg'
+
+    # Create hash of URL for uniqueness; blake2b is faster than md5 for
+    # short inputs and stays available on FIPS-restricted systems
+    url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=4).hexdigest()
+
+    return extension, url_hash
+
+
 class ImageDownloader:
     """Downloads and manages recipe step images"""
 
-    def __init__(self, download_dir: str = "images"):
+    MAX_WORKERS = 16
+    COPY_CHUNK_SIZE = 256 * 1024  # Large chunks keep write() syscalls per image low
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, download_dir: str = "images", session: Optional[requests.Session] = None):
         """
         Initialize image downloader
 
         Args:
             download_dir: Directory to store downloaded images
+            session: Shared requests session for connection reuse; must not
+                be a caching session - image bodies already live as files on
+                disk and would otherwise be stored twice
         """
         self.download_dir = download_dir
+        if session is None:
+            # Plain pooled session sized for the download worker threads
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+        self.session = session
+
+        # Cross-recipe URL dedupe shared by concurrent download_recipe_images
+        # calls: first caller claims the filename, later callers reuse it
+        self._url_filenames: Dict[str, str] = {}
+        self._url_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._state_lock = threading.Lock()
+
         self.ensure_download_directory()
 
     def ensure_download_directory(self) -> None:
@@ -41,22 +83,54 @@ class ImageDownloader:
         Returns:
             Local filename for the image
         """
-        # Parse URL to get file extension
-        parsed_url = urlparse(url)
-        path = parsed_url.path
-        extension = os.path.splitext(path)[1] or '.jpg'
-
-        # Create hash of URL for uniqueness
-        url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+        extension, url_hash = _compute_url_hash(url)
 
         # Format: recipeId_stepN_hash.ext
         filename = f"{recipe_id}_step{step_number:02d}_{url_hash}{extension}"
+
+        # Earlier versions hashed with md5; reuse such files if they are
+        # already on disk instead of re-downloading under the new name
+        if not os.path.exists(os.path.join(self.download_dir, filename)):
+            legacy_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
+            legacy_filename = f"{recipe_id}_step{step_number:02d}_{legacy_hash}{extension}"
+            if os.path.exists(os.path.join(self.download_dir, legacy_filename)):
+                return legacy_filename
+
         return filename
 
+    def _load_image_meta(self, meta_path: str) -> Dict[str, str]:
+        """Load cached validators (ETag/Last-Modified) for a downloaded image"""
+        try:
+            with open(meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_image_meta(self, meta_path: str, response: requests.Response) -> None:
+        """Store the response validators next to the image for later revalidation"""
+        meta = {}
+        if response.headers.get('ETag'):
+            meta['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            meta['last_modified'] = response.headers['Last-Modified']
+
+        if not meta:
+            return
+
+        try:
+            with open(meta_path, 'w') as f:
+                json.dump(meta, f)
+        except OSError:
+            pass
+
     def download_image(self, url: str, filename: str) -> bool:
         """
         Download single image
 
+        Existing files are revalidated with conditional headers instead of
+        re-downloaded: a 304 response costs headers only. Files without
+        stored validators are kept as-is.
+
         Args:
             url: Image URL to download
             filename: Local filename to save as
@@ -65,19 +139,35 @@ class ImageDownloader:
             True if download successful, False otherwise
         """
         filepath = os.path.join(self.download_dir, filename)
+        meta_path = filepath + '.meta'
 
-        # Skip if already exists
+        headers = {}
         if os.path.exists(filepath):
-            return True
+            meta = self._load_image_meta(meta_path)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+            # No validators to revalidate against - trust the local copy
+            if not headers:
+                return True
 
         try:
-            response = requests.get(url, stream=True)
+            response = self.session.get(url, headers=headers, stream=True)
+
+            if response.status_code == 304:
+                return True
+
             response.raise_for_status()
 
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Copy straight from the raw stream in large chunks instead of
+            # iterating 8KB pieces through Python
+            response.raw.decode_content = True
+            with open(filepath, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                shutil.copyfileobj(response.raw, f, length=self.COPY_CHUNK_SIZE)
 
+            self._save_image_meta(meta_path, response)
             return True
 
         except requests.exceptions.RequestException as e:
@@ -100,24 +190,30 @@ class ImageDownloader:
         image_map = {}
         recipe_id = recipe.identifier[:12]  # Shorten for filename
 
-        print(f"Downloading images for recipe: {recipe.title}")
-
         for step in recipe.steps:
             if not step.image_url:
                 continue
 
-            filename = self.get_image_filename(
-                step.image_url, recipe_id, step.step_number
-            )
-
-            print(f"  Step {step.step_number}: {filename}")
-
-            if self.download_image(step.image_url, filename):
+            # Reuse the filename claimed by the first recipe referencing this
+            # URL; the per-URL lock makes a concurrent second caller wait so
+            # download_image finds the file instead of fetching it again
+            with self._state_lock:
+                filename = self._url_filenames.get(step.image_url)
+                if filename is None:
+                    filename = self.get_image_filename(
+                        step.image_url, recipe_id, step.step_number
+                    )
+                    self._url_filenames[step.image_url] = filename
+                url_lock = self._url_locks[step.image_url]
+
+            with url_lock:
+                downloaded = self.download_image(step.image_url, filename)
+
+            if downloaded:
                 image_map[step.step_number] = filename
             else:
                 print(f"  ✗ Failed to download step {step.step_number} image")
 
-        print(f"  ✓ Downloaded {len(image_map)} images")
         return image_map
 
     def download_all_recipe_images(self, recipes: List[Recipe]) -> Dict[str, Dict[int, str]]:
@@ -130,12 +226,42 @@ class ImageDownloader:
         Returns:
             Dictionary mapping recipe IDs to their image maps
         """
-        all_images = {}
-
-        for i, recipe in enumerate(recipes, 1):
-            print(f"\n[{i}/{len(recipes)}] Processing images for: {recipe.title}")
-            image_map = self.download_recipe_images(recipe)
-            all_images[recipe.identifier] = image_map
+        # Flatten into independent download jobs, deduplicated by URL so an
+        # image shared between recipes (common for variants) is fetched once;
+        # a thread pool then overlaps the network waits
+        filenames: Dict[str, str] = {}  # url -> filename of the single download
+        placements: Dict[str, List[Tuple[str, int]]] = {}  # url -> [(recipe id, step number)]
+        for recipe in recipes:
+            recipe_id = recipe.identifier[:12]  # Shorten for filename
+            for step in recipe.steps:
+                if not step.image_url:
+                    continue
+                if step.image_url not in filenames:
+                    filenames[step.image_url] = self.get_image_filename(
+                        step.image_url, recipe_id, step.step_number
+                    )
+                placements.setdefault(step.image_url, []).append(
+                    (recipe.identifier, step.step_number)
+                )
+
+        all_images = {recipe.identifier: {} for recipe in recipes}
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.download_image, url, filename): url
+                for url, filename in filenames.items()
+            }
+
+            with tqdm(total=len(futures), desc="Downloading images", unit="img") as progress:
+                for future in as_completed(futures):
+                    url = futures[future]
+                    if future.result():
+                        for identifier, step_number in placements[url]:
+                            all_images[identifier][step_number] = filenames[url]
+                    else:
+                        for identifier, step_number in placements[url]:
+                            print(f"  ✗ Failed to download step {step_number} image for recipe {identifier}")
+                    progress.update(1)
 
         total_images = sum(len(imgs) for imgs in all_images.values())
         print(f"\n✓ Downloaded {total_images} total images for {len(recipes)} recipes")
@@ -166,6 +292,8 @@ class ImageDownloader:
 
         all_files = set(os.listdir(self.download_dir))
         used_files = set(used_filenames)
+        # Keep validator sidecars alongside their images
+        used_files.update(f"{filename}.meta" for filename in used_filenames)
         unused_files = all_files - used_files
 
         for filename in unused_files:
@@ -7,21 +7,125 @@ Each PDF contains the recipe title, ingredients, steps with timing,
 and step images.
 """
 
+import argparse
+import asyncio
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from tqdm import tqdm
+
 from auth import KtpncookAuth
 from api_client import KtpncookAPIClient
 from image_downloader import ImageDownloader
-from pdf_generator import PDFGenerator
+from pdf_generator import build_pdf, init_pdf_worker
+
+IMAGE_WORKERS = 8
+QUEUE_SIZE = 32
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Export ktpncook favorites as PDF files")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk API response cache and refetch everything"
+    )
+    return parser.parse_args()
+
+
+async def run_pipeline(
+    client: KtpncookAPIClient,
+    image_downloader: ImageDownloader,
+    favorites,
+    export_dir: str
+):
+    """
+    Overlap recipe fetching, image downloads and PDF generation
+
+    The phases only depend on each other per recipe, so they run as a
+    three-stage pipeline connected by queues: recipes stream out of the
+    batched fetch, image downloads run in a thread pool, and PDF builds run
+    in a process pool. Wall-clock approaches the slowest phase instead of
+    the sum of all three.
+    """
+    loop = asyncio.get_running_loop()
+    images_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    pdf_queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+    pdf_workers_count = os.cpu_count() or 1
+    image_pool = ThreadPoolExecutor(max_workers=IMAGE_WORKERS)
+    pdf_pool = ProcessPoolExecutor(
+        max_workers=pdf_workers_count,
+        initializer=init_pdf_worker,
+        initargs=(export_dir, image_downloader.download_dir)
+    )
+
+    generated_pdfs = []
+    progress = tqdm(total=len(favorites), desc="Exporting recipes", unit="recipe")
+
+    async def fetch_stage():
+        """Stream fetched recipes into the image queue"""
+        async for recipe in client.iter_recipe_details(favorites):
+            await images_queue.put(recipe)
+
+    async def image_stage():
+        """Download one recipe's images at a time, then hand off to PDF"""
+        while True:
+            recipe = await images_queue.get()
+            if recipe is None:
+                break
+            image_map = await loop.run_in_executor(
+                image_pool, image_downloader.download_recipe_images, recipe
+            )
+            await pdf_queue.put((recipe, image_map))
+
+    async def pdf_stage():
+        """Build PDFs in worker processes as recipes become ready"""
+        while True:
+            job = await pdf_queue.get()
+            if job is None:
+                break
+            recipe = job[0]
+            try:
+                pdf_path = await loop.run_in_executor(pdf_pool, build_pdf, job)
+                generated_pdfs.append(pdf_path)
+            except Exception as e:
+                print(f"  ✗ Failed to generate PDF for {recipe.title}: {e}")
+            progress.update(1)
+
+    try:
+        image_workers = [asyncio.create_task(image_stage()) for _ in range(IMAGE_WORKERS)]
+        pdf_workers = [asyncio.create_task(pdf_stage()) for _ in range(pdf_workers_count)]
+
+        await fetch_stage()
+
+        for _ in image_workers:
+            await images_queue.put(None)
+        await asyncio.gather(*image_workers)
+
+        for _ in pdf_workers:
+            await pdf_queue.put(None)
+        await asyncio.gather(*pdf_workers)
+
+    finally:
+        progress.close()
+        image_pool.shutdown()
+        pdf_pool.shutdown()
+
+    return generated_pdfs
 
 
 def main():
     """Main application entry point"""
+    args = parse_args()
+
     print("Ktpncook Recipe Exporter")
     print("========================")
 
     # Initialize authentication
-    auth = KtpncookAuth()
+    auth = KtpncookAuth(use_cache=not args.no_cache)
 
     print("Authenticating...")
     try:
@@ -45,26 +149,15 @@ def main():
         print("No favorite recipes found or failed to retrieve favorites")
         sys.exit(1)
 
-    # Get detailed recipe information
-    print("\nFetching detailed recipe information...")
-    detailed_recipes = client.get_all_recipe_details(favorites)
-
-    print(f"\n✓ Retrieved {len(detailed_recipes)} recipes successfully")
-
-    # Download images for all recipes
-    print("\nDownloading recipe images...")
-    image_downloader = ImageDownloader()
-    recipe_images = image_downloader.download_all_recipe_images(detailed_recipes)
-
-    # Generate PDFs for all recipes
-    print("\nGenerating PDF files...")
+    # Fetch, download and generate as one overlapped pipeline
+    print("\nExporting recipes...")
     export_dir = "export"
-    pdf_generator = PDFGenerator(output_dir=export_dir, image_downloader=image_downloader)
-    generated_pdfs = pdf_generator.generate_all_recipe_pdfs(detailed_recipes, recipe_images)
+    image_downloader = ImageDownloader()
+    generated_pdfs = asyncio.run(run_pipeline(client, image_downloader, favorites, export_dir))
 
     print(f"\n🎉 Export complete!")
     print(f"Generated {len(generated_pdfs)} recipe PDFs in '{export_dir}' directory")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -3,22 +3,199 @@ PDF generator for recipe documents
 """
 
 import os
-from typing import Dict, List, Optional
+import re
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 from fractions import Fraction
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch, cm
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-from PIL import Image as PILImage
+from tqdm import tqdm
 from recipe import Recipe, Ingredient
 from image_downloader import ImageDownloader
 
+# reportlab is imported lazily inside the methods that use it, so importing
+# this module (e.g. from main.py or a worker process) stays cheap
+
+def _build_styles():
+    """Build the sample stylesheet plus custom recipe styles (once per process)"""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+
+    # Recipe title style
+    styles.add(ParagraphStyle(
+        name='RecipeTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        textColor=colors.darkblue
+    ))
+
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceBefore=12,
+        spaceAfter=6,
+        textColor=colors.darkgreen
+    ))
+
+    # Step title style
+    styles.add(ParagraphStyle(
+        name='StepTitle',
+        parent=styles['Heading3'],
+        fontSize=14,
+        spaceBefore=8,
+        spaceAfter=4,
+        textColor=colors.darkred
+    ))
+
+    # Ingredient style
+    styles.add(ParagraphStyle(
+        name='Ingredient',
+        parent=styles['Normal'],
+        fontSize=10,
+        leftIndent=20,
+        bulletIndent=10
+    ))
+
+    return styles
+
+
+# JPEG start-of-frame markers that carry the image dimensions
+# (0xC4/0xC8/0xCC in the same range are tables, not frames)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _peek_image_size(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) directly from JPEG/PNG headers
+
+    Both formats store the dimensions within the first few dozen bytes, so
+    this costs one small read instead of an image decode. Returns None for
+    anything else so the caller can fall back to a full parser.
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(26)
+
+            # PNG: dimensions sit in the IHDR chunk right after the signature
+            if head.startswith(b'\x89PNG\r\n\x1a\n'):
+                if head[12:16] == b'IHDR':
+                    width, height = struct.unpack('>II', head[16:24])
+                    return width, height
+                return None
+
+            # JPEG: scan segment markers until a start-of-frame
+            if head.startswith(b'\xff\xd8'):
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        return None
+
+                    code = marker[1]
+                    # Fill bytes: the real marker code may follow
+                    if code == 0xFF:
+                        f.seek(-1, os.SEEK_CUR)
+                        continue
+                    # Standalone markers (padding, restart) have no length field
+                    if code == 0x01 or 0xD0 <= code <= 0xD8:
+                        continue
+
+                    length_bytes = f.read(2)
+                    if len(length_bytes) < 2:
+                        return None
+                    (segment_length,) = struct.unpack('>H', length_bytes)
+
+                    if code in _JPEG_SOF_MARKERS:
+                        frame = f.read(5)
+                        if len(frame) < 5:
+                            return None
+                        height, width = struct.unpack('>HH', frame[1:5])
+                        return width, height
+
+                    f.seek(segment_length - 2, os.SEEK_CUR)
+
+    except (OSError, struct.error):
+        return None
+
+    return None
+
+
+# Characters stripped from recipe titles when building PDF filenames;
+# \w keeps unicode letters, so German titles survive sanitization intact
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]+', re.UNICODE)
+
+_STYLES = None
+
+
+def _get_styles():
+    """Return the shared stylesheet, building it on first use"""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = _build_styles()
+    return _STYLES
+
+
+def _format_doubled_quantity(doubled: float) -> str:
+    """Format an already-doubled quantity as an integer, fraction or decimal"""
+    # If it's a whole number, return as integer
+    if doubled == int(doubled):
+        return str(int(doubled))
+
+    # Convert to fraction
+    frac = Fraction(doubled).limit_denominator(16)  # Limit to simple fractions
+
+    # If the fraction is very close to the decimal, use the fraction
+    if abs(float(frac) - doubled) < 0.01:
+        if frac.numerator > frac.denominator:
+            # Mixed number (e.g., 1 1/2 instead of 3/2)
+            whole = frac.numerator // frac.denominator
+            remainder = frac.numerator % frac.denominator
+            if remainder == 0:
+                return str(whole)
+            else:
+                return f"{whole} {remainder}/{frac.denominator}"
+        else:
+            # Simple fraction (e.g., 1/2, 2/3)
+            return f"{frac.numerator}/{frac.denominator}"
+    else:
+        # If fraction doesn't represent the decimal well, use decimal with 1 decimal place
+        return f"{doubled:.1f}".rstrip('0').rstrip('.')
+
+
+# Doubled quantities snap to sixteenths, so quantity * 32 is an integer for
+# every value the fraction logic can represent; precompute those strings
+_QTY_CACHE = {key: _format_doubled_quantity(key / 16) for key in range(513)}
+
+# Per-process generator for the PDF worker pool, set up by init_pdf_worker
+_worker_generator: Optional['PDFGenerator'] = None
+
+
+def init_pdf_worker(output_dir: str, image_dir: str) -> None:
+    """Build one PDFGenerator per worker process"""
+    global _worker_generator
+    _worker_generator = PDFGenerator(
+        output_dir=output_dir,
+        image_downloader=ImageDownloader(download_dir=image_dir)
+    )
+
+
+def build_pdf(job: Tuple[Recipe, Dict[int, str]]) -> str:
+    """Generate one recipe PDF in a worker process"""
+    recipe, recipe_images = job
+    return _worker_generator.generate_recipe_pdf(recipe, recipe_images)
+
 
 class PDFGenerator:
     """Generates PDF documents for recipes"""
 
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
     def __init__(self, output_dir: str = ".", image_downloader: Optional[ImageDownloader] = None):
         """
         Initialize PDF generator
@@ -31,84 +208,24 @@ class PDFGenerator:
         self.image_downloader = image_downloader or ImageDownloader()
         self.ensure_output_directory()
 
-        # Setup styles
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        # Styles are built once per process and shared between instances
+        self.styles = _get_styles()
 
     def ensure_output_directory(self) -> None:
         """Create output directory if it doesn't exist"""
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
-    def setup_custom_styles(self) -> None:
-        """Define custom paragraph styles for the PDF"""
-        # Recipe title style
-        self.styles.add(ParagraphStyle(
-            name='RecipeTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        ))
-
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceBefore=12,
-            spaceAfter=6,
-            textColor=colors.darkgreen
-        ))
-
-        # Step title style
-        self.styles.add(ParagraphStyle(
-            name='StepTitle',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            spaceBefore=8,
-            spaceAfter=4,
-            textColor=colors.darkred
-        ))
-
-        # Ingredient style
-        self.styles.add(ParagraphStyle(
-            name='Ingredient',
-            parent=self.styles['Normal'],
-            fontSize=10,
-            leftIndent=20,
-            bulletIndent=10
-        ))
-
     def format_quantity(self, quantity: float) -> str:
         """Convert decimal quantities to readable fractions when appropriate"""
+        # Common quantities hit the precomputed table; Fraction construction
+        # only runs for values outside it
+        key = round(quantity * 32)
+        if 0 <= key <= 512 and abs(quantity * 32 - key) < 1e-9:
+            return _QTY_CACHE[key]
+
         # Double the quantity for 2 portions
-        doubled = quantity * 2
-
-        # If it's a whole number, return as integer
-        if doubled == int(doubled):
-            return str(int(doubled))
-
-        # Convert to fraction
-        frac = Fraction(doubled).limit_denominator(16)  # Limit to simple fractions
-
-        # If the fraction is very close to the decimal, use the fraction
-        if abs(float(frac) - doubled) < 0.01:
-            if frac.numerator > frac.denominator:
-                # Mixed number (e.g., 1 1/2 instead of 3/2)
-                whole = frac.numerator // frac.denominator
-                remainder = frac.numerator % frac.denominator
-                if remainder == 0:
-                    return str(whole)
-                else:
-                    return f"{whole} {remainder}/{frac.denominator}"
-            else:
-                # Simple fraction (e.g., 1/2, 2/3)
-                return f"{frac.numerator}/{frac.denominator}"
-        else:
-            # If fraction doesn't represent the decimal well, use decimal with 1 decimal place
-            return f"{doubled:.1f}".rstrip('0').rstrip('.')
+        return _format_doubled_quantity(quantity * 2)
 
     def format_ingredient(self, ingredient: Ingredient) -> str:
         """Format ingredient for display (scaled for 2 portions)"""
@@ -123,6 +240,9 @@ class PDFGenerator:
 
     def add_recipe_header(self, story: List, recipe: Recipe) -> None:
         """Add recipe title and basic info to the story"""
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+
         # Recipe title
         story.append(Paragraph(recipe.title, self.styles['RecipeTitle']))
         story.append(Spacer(1, 12))
@@ -161,6 +281,8 @@ class PDFGenerator:
 
     def add_ingredients_section(self, story: List, recipe: Recipe) -> None:
         """Add ingredients section to the story"""
+        from reportlab.platypus import Paragraph, Spacer
+
         if not recipe.all_ingredients:
             return
 
@@ -172,15 +294,23 @@ class PDFGenerator:
 
         story.append(Spacer(1, 16))
 
-    def add_recipe_image(self, story: List, image_path: str, max_width: float = 4*inch) -> None:
-        """Add an image to the story with appropriate sizing"""
+    def add_recipe_image(self, story: List, image_path: str, max_width: float = 288.0) -> None:
+        """Add an image to the story with appropriate sizing (max_width in points, default 4 inches)"""
+        from reportlab.lib.utils import ImageReader
+        from reportlab.platypus import Image, Spacer
+
         if not os.path.exists(image_path):
             return
 
         try:
-            # Get image dimensions
-            with PILImage.open(image_path) as pil_img:
-                img_width, img_height = pil_img.size
+            # Get image dimensions straight from the JPEG/PNG header; exotic
+            # formats fall back to a reportlab ImageReader. Either way the
+            # probe only computes the scale - the flowable gets the path,
+            # which is the only source platypus.Image accepts
+            size = _peek_image_size(image_path)
+            if size is None:
+                size = ImageReader(image_path).getSize()
+            img_width, img_height = size
 
             # Calculate scaled dimensions
             if img_width > max_width:
@@ -201,6 +331,8 @@ class PDFGenerator:
 
     def add_steps_section(self, story: List, recipe: Recipe, recipe_images: Dict[int, str]) -> None:
         """Add cooking steps section to the story"""
+        from reportlab.platypus import Paragraph, Spacer
+
         if not recipe.steps:
             return
 
@@ -229,13 +361,8 @@ class PDFGenerator:
 
     def generate_recipe_filename(self, recipe: Recipe) -> str:
         """Generate safe filename for recipe PDF"""
-        # Clean title for filename
-        safe_title = "".join(c for c in recipe.title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title.replace(' ', '_')
-
-        # Truncate if too long
-        if len(safe_title) > 50:
-            safe_title = safe_title[:50]
+        # Clean title for filename, truncated to 50 characters
+        safe_title = _UNSAFE_FILENAME_CHARS.sub('', recipe.title).rstrip().replace(' ', '_')[:50]
 
         return f"{safe_title}.pdf"
 
@@ -250,33 +377,40 @@ class PDFGenerator:
         Returns:
             Path to generated PDF file
         """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.platypus import SimpleDocTemplate
+
         filename = self.generate_recipe_filename(recipe)
         filepath = os.path.join(self.output_dir, filename)
 
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            filepath,
-            pagesize=A4,
-            rightMargin=2*cm,
-            leftMargin=2*cm,
-            topMargin=2*cm,
-            bottomMargin=2*cm
-        )
+        # Hand reportlab a buffered file object so its many small writes
+        # during build coalesce instead of each hitting the kernel
+        with open(filepath, 'wb', buffering=self.WRITE_BUFFER_SIZE) as pdf_file:
+            # Create PDF document
+            doc = SimpleDocTemplate(
+                pdf_file,
+                pagesize=A4,
+                rightMargin=2*cm,
+                leftMargin=2*cm,
+                topMargin=2*cm,
+                bottomMargin=2*cm
+            )
 
-        # Build story
-        story = []
+            # Build story
+            story = []
 
-        # Add recipe header
-        self.add_recipe_header(story, recipe)
+            # Add recipe header
+            self.add_recipe_header(story, recipe)
 
-        # Add ingredients section
-        self.add_ingredients_section(story, recipe)
+            # Add ingredients section
+            self.add_ingredients_section(story, recipe)
 
-        # Add steps section
-        self.add_steps_section(story, recipe, recipe_images)
+            # Add steps section
+            self.add_steps_section(story, recipe, recipe_images)
 
-        # Build PDF
-        doc.build(story)
+            # Build PDF
+            doc.build(story)
 
         return filepath
 
@@ -295,21 +429,35 @@ class PDFGenerator:
         Returns:
             List of generated PDF file paths
         """
-        generated_files = []
-
-        for i, recipe in enumerate(recipes, 1):
-            print(f"Generating PDF {i}/{len(recipes)}: {recipe.title}")
+        # Each PDF build is an independent, CPU-bound reportlab run, so spread
+        # them over worker processes (threads would serialize on the GIL)
+        jobs = [
+            (recipe, all_recipe_images.get(recipe.identifier, {}))
+            for recipe in recipes
+        ]
+        max_workers = os.cpu_count() or 1
 
-            # Get images for this recipe
-            recipe_images = all_recipe_images.get(recipe.identifier, {})
-
-            try:
-                pdf_path = self.generate_recipe_pdf(recipe, recipe_images)
-                generated_files.append(pdf_path)
-                print(f"  ✓ Generated: {os.path.basename(pdf_path)}")
-
-            except Exception as e:
-                print(f"  ✗ Failed to generate PDF for {recipe.title}: {e}")
+        generated_files = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_pdf_worker,
+            initargs=(self.output_dir, self.image_downloader.download_dir)
+        ) as executor:
+            futures = {
+                executor.submit(build_pdf, job): job[0]
+                for job in jobs
+            }
+
+            with tqdm(total=len(futures), desc="Generating PDFs", unit="pdf") as progress:
+                for future in as_completed(futures):
+                    recipe = futures[future]
+                    try:
+                        generated_files.append(future.result())
+
+                    except Exception as e:
+                        print(f"  ✗ Failed to generate PDF for {recipe.title}: {e}")
+
+                    progress.update(1)
 
         print(f"\n✓ Generated {len(generated_files)} PDFs successfully")
         return generated_files
\ No newline at end of file
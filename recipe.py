@@ -2,11 +2,12 @@
 Recipe data model for ktpncook recipes
 """
 
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Ingredient:
     """Represents a recipe ingredient with quantity and unit"""
     title: str
@@ -30,7 +31,7 @@ class Ingredient:
             # Main ingredient format
             title = ingredient.get("title", "Unknown ingredient")
 
-        return cls(
+        return _intern_ingredient(
             title=title,
             quantity=unit.get("quantity"),
             measure=unit.get("measure"),
@@ -38,7 +39,30 @@ class Ingredient:
         )
 
 
-@dataclass
+# Ingredient titles and measures repeat across recipes ("Zwiebel", "g"),
+# so identical field tuples share one frozen instance
+_INGREDIENT_CACHE: Dict[Tuple, Ingredient] = {}
+
+
+def _intern_ingredient(
+    title: str,
+    quantity: Optional[float] = None,
+    measure: Optional[str] = None,
+    ingredient_id: Optional[str] = None
+) -> Ingredient:
+    """Return a shared Ingredient instance for the given field values"""
+    title = sys.intern(title)
+    if measure:
+        measure = sys.intern(measure)
+
+    key = (title, quantity, measure, ingredient_id)
+    ingredient = _INGREDIENT_CACHE.get(key)
+    if ingredient is None:
+        ingredient = _INGREDIENT_CACHE[key] = Ingredient(title, quantity, measure, ingredient_id)
+    return ingredient
+
+
+@dataclass(slots=True)
 class RecipeStep:
     """Represents a single recipe step"""
     title: str
@@ -50,9 +74,10 @@ class RecipeStep:
     def from_api_data(cls, data: Dict[str, Any], step_number: int) -> 'RecipeStep':
         """Create RecipeStep from API response data"""
         # Parse ingredients for this step
-        step_ingredients = []
-        for ing_data in data.get("ingredients", []):
-            step_ingredients.append(Ingredient.from_api_data(ing_data))
+        step_ingredients = [
+            Ingredient.from_api_data(ing_data)
+            for ing_data in data.get("ingredients", [])
+        ]
 
         # Get image URL
         image_url = None
@@ -67,7 +92,7 @@ class RecipeStep:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Recipe:
     """Complete recipe with all details"""
     identifier: str
@@ -83,28 +108,21 @@ class Recipe:
     def from_api_data(cls, data: Dict[str, Any]) -> 'Recipe':
         """Create Recipe from API response data"""
         # Parse steps
-        steps = []
-        all_ingredients_set = set()
-
-        for i, step_data in enumerate(data.get("steps", []), 1):
-            step = RecipeStep.from_api_data(step_data, i)
-            steps.append(step)
-
-            # Collect all ingredients mentioned in steps
-            for ingredient in step.ingredients:
-                if ingredient.ingredient_id:
-                    all_ingredients_set.add(ingredient.ingredient_id)
+        steps = [
+            RecipeStep.from_api_data(step_data, i)
+            for i, step_data in enumerate(data.get("steps", []), 1)
+        ]
 
         # Parse global ingredients list
-        all_ingredients = []
-        for ing_data in data.get("ingredients", []):
-            ingredient_obj = ing_data.get("ingredient", {})
-            all_ingredients.append(Ingredient(
-                title=ingredient_obj.get("title", "Unknown"),
+        all_ingredients = [
+            _intern_ingredient(
+                title=ing_data.get("ingredient", {}).get("title", "Unknown"),
                 quantity=ing_data.get("quantity"),
                 measure=ing_data.get("measure"),
-                ingredient_id=ingredient_obj.get("_id", {}).get("$oid")
-            ))
+                ingredient_id=ing_data.get("ingredient", {}).get("_id", {}).get("$oid")
+            )
+            for ing_data in data.get("ingredients", [])
+        ]
 
         return cls(
             identifier=data.get("_id", {}).get("$oid", ""),